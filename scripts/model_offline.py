@@ -11,6 +11,11 @@ from virtual_bus.bus.model_v1 import (
     load_model,
 )
 
+# json.dumps() with non-default options builds a new encoder per call; reuse one.
+_EVENT_ENCODER = json.JSONEncoder(ensure_ascii=False)
+_WRITE_CHUNK_BYTES = 64 * 1024
+
+
 def main() -> int:
     ap = argparse.ArgumentParser(description="Offline ML V1: train on signals.jsonl, write model_events.jsonl")
     ap.add_argument("--input", type=Path, required=True, help="Path to signals.jsonl")
@@ -39,13 +44,24 @@ def main() -> int:
         min_samples=args.min_samples
     )
 
-    # Write output
+    # Write output in ~64 KiB chunks instead of one write() per event
     args.out.parent.mkdir(parents=True, exist_ok=True)
+    encode = _EVENT_ENCODER.encode
     with args.out.open("w", encoding="utf-8") as f:
         n = 0
+        buf: list[str] = []
+        buf_len = 0
         for ev in events_iter:
-            f.write(json.dumps(ev, ensure_ascii=False) + "\n")
+            line = encode(ev) + "\n"
+            buf.append(line)
+            buf_len += len(line)
             n += 1
+            if buf_len >= _WRITE_CHUNK_BYTES:
+                f.write("".join(buf))
+                buf.clear()
+                buf_len = 0
+        if buf:
+            f.write("".join(buf))
 
     report["score"] = {
         "input": str(args.input),
@@ -6,16 +6,19 @@ import time
 from pathlib import Path
 from typing import Any
 
-from virtual_bus.bus.bus import Bus
+from virtual_bus.bus.bus import TypedBus
 from virtual_bus.bus.types import Frame, Signal
 from virtual_bus.bus.normalizer import Normalizer
 from virtual_bus.bus.analyzer import Analyzer
 from virtual_bus.bus.replayer import FrameReplayer
 
 
+ROOT = Path(__file__).resolve().parents[1]
+
+
 def nice_path(path: Path, base: Path) -> str:
     try:
-        return str(path.resolve().relative_to(base.resolve()))
+        return str(path.resolve().relative_to(base))
     except Exception:
         return str(path)
 
@@ -73,7 +76,6 @@ def main() -> None:
 
     start = time.perf_counter()
 
-    root = Path(__file__).resolve().parents[1]
     infile = args.infile
 
     if not infile.exists():
@@ -93,14 +95,13 @@ def main() -> None:
     anomaly_rate = meta.get("anomaly_rate", 0.0)
     mapping = decode_mapping(meta.get("mapping"))
 
-    frame_bus: Bus[Frame] = Bus()
-    signal_bus: Bus[Signal] = Bus()
+    bus = TypedBus()
 
     analyzer = Analyzer(outdir)
-    signal_bus.subscribe(analyzer.on_signal)
+    bus.subscribe(Signal, analyzer.on_signal)
 
-    normalizer = Normalizer(outdir, mapping, publish_signal=signal_bus.publish)
-    frame_bus.subscribe(normalizer.on_frame)
+    normalizer = Normalizer(outdir, mapping, publish_signal=bus.publish)
+    bus.subscribe(Frame, normalizer.on_frame)
 
     replayer = FrameReplayer(
         infile,
@@ -108,15 +109,17 @@ def main() -> None:
         speed=args.speed,
     )
 
-    replayed = replayer.run(frame_bus.publish, limit=args.limit)
+    try:
+        replayed = replayer.run(bus.publish, limit=args.limit)
+    finally:
+        # Sinks buffer their output; close them even if replay fails part-way
+        normalizer.close()
+        analyzer.close()
     elapsed = time.perf_counter() - start
 
-    normalizer.close()
-    analyzer.close()
-
-    frames_path = infile
-    signals_path = outdir / "signals.jsonl"
-    events_path = outdir / "events.jsonl"
+    frames_shown = nice_path(infile, ROOT)
+    signals_shown = nice_path(normalizer.writer.path, ROOT)
+    events_shown = nice_path(analyzer.writer.path, ROOT)
 
     print("=== Demo complete ===")
     print(f"Mode:             {mode}")
@@ -124,9 +127,9 @@ def main() -> None:
     print(f"Profile:          {profile}")
     print(f"Seed:             {seed}")
     print(f"Frames sent:      {replayed}")
-    print(f"Frames stored:    {replayed:<4} -> {nice_path(frames_path, root)}")
-    print(f"Signals stored:   {normalizer.count:<4} -> {nice_path(signals_path, root)}")
-    print(f"Events stored:    {analyzer.count:<4} -> {nice_path(events_path, root)}")
+    print(f"Frames stored:    {replayed:<4} -> {frames_shown}")
+    print(f"Signals stored:   {normalizer.count:<4} -> {signals_shown}")
+    print(f"Events stored:    {analyzer.count:<4} -> {events_shown}")
     print(f"Elapsed time:     {elapsed:.3f} s")
 
 
@@ -7,17 +7,20 @@ import threading
 from pathlib import Path
 from datetime import datetime, timezone
 
-from virtual_bus.bus.bus import Bus
+from virtual_bus.bus.bus import TypedBus
 from virtual_bus.bus.types import Frame, Signal
 from virtual_bus.bus.observer import Observer
 from virtual_bus.bus.generator import create_traffic_generator
 from virtual_bus.bus.normalizer import Normalizer
-from virtual_bus.bus.analyzer import Analyzer
+from virtual_bus.bus.analyzer import FLUSH_INTERVAL_S, Analyzer
+
+
+ROOT = Path(__file__).resolve().parents[1]
 
 
 def nice_path(path: Path, base: Path) -> str:
     try:
-        return str(path.resolve().relative_to(base.resolve()))
+        return str(path.resolve().relative_to(base))
     except Exception:
         return str(path)
 
@@ -47,21 +50,28 @@ def main() -> None:
     args = parser.parse_args()
 
     start = time.perf_counter()
-    root = Path(__file__).resolve().parents[1]
     run_stamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
 
     # Keeps runs separated to never overwrite previous artifacts
-    artifacts_dir = root / "artifacts" / args.mode / args.profile / run_stamp
+    artifacts_dir = ROOT / "artifacts" / args.mode / args.profile / run_stamp
     artifacts_dir.mkdir(parents=True, exist_ok=False)
 
-    frame_bus: Bus[Frame] = Bus()
-    signal_bus: Bus[Signal] = Bus()
+    duration_s = args.duration_s
+    if duration_s <= 0:
+        duration_s = None  # infinite run
+
+    # Sinks buffer their output; in an infinite run, flush frames/signals on the first
+    # append after FLUSH_INTERVAL_S (as the Analyzer does for feed.jsonl) so the files
+    # keep up with the [running] counters while traffic flows
+    live_flush_s = FLUSH_INTERVAL_S if duration_s is None else None
 
-    observer = Observer(artifacts_dir)
-    frame_bus.subscribe(observer.on_frame)
+    bus = TypedBus()
+
+    observer = Observer(artifacts_dir, flush_interval_s=live_flush_s)
+    bus.subscribe(Frame, observer.on_frame)
 
     analyzer = Analyzer(artifacts_dir)
-    signal_bus.subscribe(analyzer.on_signal)
+    bus.subscribe(Signal, analyzer.on_signal)
 
     if args.profile == "single":
         mapping = {0x123: [("counter", 0, "count")]}
@@ -97,8 +107,8 @@ def main() -> None:
         encoding="utf-8",
     )
 
-    normalizer = Normalizer(artifacts_dir, mapping, publish_signal=signal_bus.publish)
-    frame_bus.subscribe(normalizer.on_frame)
+    normalizer = Normalizer(artifacts_dir, mapping, publish_signal=bus.publish, flush_interval_s=live_flush_s)
+    bus.subscribe(Frame, normalizer.on_frame)
 
     gen = create_traffic_generator(
         scenario=args.mode,
@@ -108,20 +118,23 @@ def main() -> None:
         anomaly_rate=args.anomaly_rate,
     )
 
-    duration_s = args.duration_s
-    if duration_s <= 0:
-        duration_s = None  # infinite run
-
     sent = 0
     shutdown_event = threading.Event()
 
     def run_generator():
         nonlocal sent
-        sent = gen.run(
-            frame_bus.publish,
-            duration_s=duration_s,
-            should_stop=shutdown_event.is_set,   # NEW
-        )
+        try:
+            sent = gen.run(
+                bus.publish,
+                duration_s=duration_s,
+                should_stop=shutdown_event.is_set,   # NEW
+            )
+        finally:
+            # Sinks buffer their output and are only written from this thread, so
+            # close them here, once the generator has stopped appending
+            observer.close()
+            normalizer.close()
+            analyzer.close()
 
     thread = threading.Thread(target=run_generator)
     thread.start()
@@ -142,9 +155,9 @@ def main() -> None:
 
     elapsed = time.perf_counter() - start
 
-    frames_path = artifacts_dir / "frames.jsonl"
-    signals_path = artifacts_dir / "signals.jsonl"
-    events_path = artifacts_dir / "events.jsonl"
+    frames_shown = nice_path(observer.writer.path, ROOT)
+    signals_shown = nice_path(normalizer.writer.path, ROOT)
+    events_shown = nice_path(analyzer.writer.path, ROOT)
 
     print("=== Demo complete ===")
     print(f"Mode:             {args.mode}")
@@ -155,9 +168,9 @@ def main() -> None:
     print(f"Profile:          {args.profile}")
     print(f"Seed:             {args.seed}")
     print(f"Frames sent:      {sent}")
-    print(f"Frames stored:    {observer.count}  -> {nice_path(frames_path, root)}")
-    print(f"Signals stored:   {normalizer.count}  -> {nice_path(signals_path, root)}")
-    print(f"Events stored:    {analyzer.count}    -> {nice_path(events_path, root)}")
+    print(f"Frames stored:    {observer.count}  -> {frames_shown}")
+    print(f"Signals stored:   {normalizer.count}  -> {signals_shown}")
+    print(f"Events stored:    {analyzer.count}    -> {events_shown}")
     print(f"Elapsed time:     {elapsed:.3f} s")
 
 
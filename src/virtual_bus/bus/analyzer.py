@@ -1,126 +1,142 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Callable, Optional, Dict
 
-from .types import Event, Signal, FeedRecord
+from .types import Event, Signal
 from .jsonl import JsonlWriter
 
+FLUSH_INTERVAL_S = 0.05
+
 
 class Analyzer:
     
     def __init__(self, artifacts_dir: Path, watch_signals: Optional[set[str]] = None) -> None:
-        self.watch_signals = watch_signals
-        self.feed_writer = JsonlWriter(artifacts_dir / "feed.jsonl")
-        self.writer = JsonlWriter(artifacts_dir / "events.jsonl")
+        self.watch_signals = frozenset(watch_signals) if watch_signals is not None else None
+        # feed.jsonl gets a row per signal, so it is buffered and flushed on the first
+        # row after FLUSH_INTERVAL_S; events are rare, so each one is written straight out
+        self.feed_writer = JsonlWriter(artifacts_dir / "feed.jsonl", flush_interval_s=FLUSH_INTERVAL_S)
+        self.writer = JsonlWriter(artifacts_dir / "events.jsonl", flush_every_n=1)
         self._last_by_name: Dict[str, int] = {}
         self.count = 0
         self.feed_count = 0
 
+        # Signal name -> rule, looked up once per signal instead of an if-chain
+        # of string compares
+        self._rules: Dict[str, Callable[[Signal, int, int], None]] = {
+            "counter": self._rule_counter,
+            "temperature_deciC": self._rule_temperature,
+            "voltage_mv": self._rule_voltage,
+        }
+
     def on_signal(self, sig: Signal) -> None:
-        rec = FeedRecord(
-            timestamp_ns=sig.timestamp_ns,
-            record_type="SIGNAL",
-            severity="INFO" if sig.quality == "OK" else "WARN",
-            subject=sig.name,
-            details={
-                "value": sig.value,
-                "units": sig.units,
-                "quality": sig.quality,
-                "source_can_id": sig.source_can_id,
-                "source_channel": sig.source_channel,
-                "source_node": sig.source_node,
-                "meta": sig.meta,
-            },
+        # Same row as FeedRecord(record_type="SIGNAL", ...).to_dict(), built directly:
+        # this runs for every signal, and the Signal already guarantees a valid timestamp
+        self.feed_writer.append(
+            {
+                "timestamp_ns": sig.timestamp_ns,
+                "event_type": "SIGNAL",
+                "severity": "INFO" if sig.quality == "OK" else "WARN",
+                "subject": sig.name,
+                "details": {
+                    "value": sig.value,
+                    "units": sig.units,
+                    "quality": sig.quality,
+                    "source_can_id": sig.source_can_id,
+                    "source_channel": sig.source_channel,
+                    "source_node": sig.source_node,
+                    "meta": sig.meta,
+                },
+                "run_id": None,
+            }
         )
 
-        self.feed_writer.append(rec.to_dict())
-
         self.feed_count += 1
 
         if sig.quality != "OK":
             return
-        if self.watch_signals is not None and sig.name not in self.watch_signals:
+
+        name = sig.name
+        if self.watch_signals is not None and name not in self.watch_signals:
             return
-        
+
         v = int(sig.value)
-        last = self._last_by_name.get(sig.name)
-
-        # ---- Rule 1: Counter jump ----
-        if sig.name == "counter":
-            if last is not None:
-                expected = (last + 1) % 256
-                if v != expected:
-                    ev = Event(
-                        timestamp_ns=sig.timestamp_ns,
-                        event_type="COUNTER_JUMP",
-                        severity="WARN",
-                        subject=sig.name,
-                        details={
-                            "last": last,
-                            "expected": expected,
-                            "got": v,
-                            "units": sig.units,
-                            "source_can_id": sig.source_can_id,
-                            "source_node": sig.source_node,
-                        },
-                    )
-                    self.writer.append(ev.to_dict())
-                    self.count += 1
-
-            self._last_by_name[sig.name] = v
-            return
-        
-        # ---- Rule 2: Temperature spike ----
-        if sig.name == "temperature_deciC":
-            if last is not None:
-                dv = v - last
-                if abs(dv) > 5:  # > 0.5C jump frame-to-frame
-                    ev = Event(
-                        timestamp_ns=sig.timestamp_ns,
-                        event_type="TEMP_SPIKE",
-                        severity="WARN",
-                        subject=sig.name,
-                        details={
-                            "last": last,
-                            "got": v,
-                            "delta_deciC": dv,
-                            "units": sig.units,
-                            "source_can_id": sig.source_can_id,
-                            "source_node": sig.source_node,
-                        },
-                    )
-                    self.writer.append(ev.to_dict())
-                    self.count += 1
-            self._last_by_name[sig.name] = v
-            return
-        
-        # ---- Rule 3: Voltage spike/sag ----
-        if sig.name == "voltage_mv":
-            if last is not None:
-                dv = v - last
-                if abs(dv) > 100:  # > 0.1V jump frame-to-frame
-                    ev = Event(
-                        timestamp_ns=sig.timestamp_ns,
-                        event_type="VOLTAGE_SPIKE",
-                        severity="WARN",
-                        subject=sig.name,
-                        details={
-                            "last": last,
-                            "got": v,
-                            "delta_mv": dv,
-                            "units": sig.units,
-                            "source_can_id": sig.source_can_id,
-                            "source_node": sig.source_node,
-                        },
-                    )
-                    self.writer.append(ev.to_dict())
-                    self.count += 1
-            self._last_by_name[sig.name] = v
-            return
-        
-        # Default: track last so future rules can be added easily
-        self._last_by_name[sig.name] = v
+        last = self._last_by_name.get(name)
+
+        # Rules only compare against a previous value; every name tracks last
+        # so future rules can be added easily
+        if last is not None:
+            rule = self._rules.get(name)
+            if rule is not None:
+                rule(sig, last, v)
+        self._last_by_name[name] = v
+
+    def _emit(self, ev: Event) -> None:
+        self.writer.append(ev.to_dict())
+        self.count += 1
+
+    # ---- Rule 1: Counter jump ----
+    def _rule_counter(self, sig: Signal, last: int, v: int) -> None:
+        expected = (last + 1) % 256
+        if v != expected:
+            self._emit(
+                Event(
+                    timestamp_ns=sig.timestamp_ns,
+                    event_type="COUNTER_JUMP",
+                    severity="WARN",
+                    subject=sig.name,
+                    details={
+                        "last": last,
+                        "expected": expected,
+                        "got": v,
+                        "units": sig.units,
+                        "source_can_id": sig.source_can_id,
+                        "source_node": sig.source_node,
+                    },
+                )
+            )
+
+    # ---- Rule 2: Temperature spike ----
+    def _rule_temperature(self, sig: Signal, last: int, v: int) -> None:
+        dv = v - last
+        if abs(dv) > 5:  # > 0.5C jump frame-to-frame
+            self._emit(
+                Event(
+                    timestamp_ns=sig.timestamp_ns,
+                    event_type="TEMP_SPIKE",
+                    severity="WARN",
+                    subject=sig.name,
+                    details={
+                        "last": last,
+                        "got": v,
+                        "delta_deciC": dv,
+                        "units": sig.units,
+                        "source_can_id": sig.source_can_id,
+                        "source_node": sig.source_node,
+                    },
+                )
+            )
+
+    # ---- Rule 3: Voltage spike/sag ----
+    def _rule_voltage(self, sig: Signal, last: int, v: int) -> None:
+        dv = v - last
+        if abs(dv) > 100:  # > 0.1V jump frame-to-frame
+            self._emit(
+                Event(
+                    timestamp_ns=sig.timestamp_ns,
+                    event_type="VOLTAGE_SPIKE",
+                    severity="WARN",
+                    subject=sig.name,
+                    details={
+                        "last": last,
+                        "got": v,
+                        "delta_mv": dv,
+                        "units": sig.units,
+                        "source_can_id": sig.source_can_id,
+                        "source_node": sig.source_node,
+                    },
+                )
+            )
 
     def close(self) -> None:
         self.writer.close()
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Generic, List, TypeVar
+from typing import Any, Callable, Dict, Generic, List, TypeVar
 import threading
 
 T = TypeVar("T")
@@ -24,12 +24,41 @@ class Bus(Generic[T]):
             self._subs = []
         self._lock = threading.Lock()
 
+        # Copy-on-write snapshots: subscribe() swaps in new tuples under the lock and
+        # publish() reads them lock-free (a single attribute read is atomic under the GIL)
+        self._snapshot: tuple[Subscriber[T], ...] = tuple(self._subs)
+
     def subscribe(self, fn: Subscriber[T]) -> None:
         with self._lock:
             self._subs.append(fn)
+            self._snapshot = self._snapshot + (fn,)
 
     def publish(self, msg: T) -> None:
+        for fn in self._snapshot:
+            fn(msg)
+
+
+@dataclass
+class TypedBus:
+    # One in-process bus carrying several message types (e.g. Frame and Signal).
+
+    # Same semantics as Bus, except subscribers register for a message type and
+    # publish() dispatches on type(msg), so a single bus can replace one Bus per
+    # stage without the extra hop through a second publish().
+
+    def __post_init__(self) -> None:
+        self._subs: Dict[type, List[Subscriber[Any]]] = {}
+        self._lock = threading.Lock()
+
+        # Copy-on-write per-type snapshots, replaced wholesale by subscribe() and
+        # read lock-free by publish()
+        self._snapshots: Dict[type, tuple[Subscriber[Any], ...]] = {}
+
+    def subscribe(self, msg_type: type, fn: Subscriber[Any]) -> None:
         with self._lock:
-            subs = list(self._subs)
-        for fn in subs:
+            self._subs.setdefault(msg_type, []).append(fn)
+            self._snapshots = {**self._snapshots, msg_type: tuple(self._subs[msg_type])}
+
+    def publish(self, msg: Any) -> None:
+        for fn in self._snapshots.get(type(msg), ()):
             fn(msg)
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import random
+import struct
 import time
 from dataclasses import dataclass, field
 from typing import Callable, Optional, Protocol, Literal, List, Dict, Any, Tuple
 
 from .types import Frame
 
+# Bytes 0-1 of temperature/voltage payloads: unsigned 16-bit little endian
+_U16LE = struct.Struct("<H")
+
 
 # -------------------------
 # Clock abstraction
@@ -14,6 +18,8 @@ from .types import Frame
 
 class Clock(Protocol):
     def time_ns(self) -> int: ...
+    # Pacing reference: must advance with sleep(), unaffected by wall-clock changes
+    def monotonic_ns(self) -> int: ...
     def sleep(self, seconds: float) -> None: ...
 
 @dataclass
@@ -21,6 +27,9 @@ class RealClock:
     def time_ns(self) -> int:
         return time.time_ns()
 
+    def monotonic_ns(self) -> int:
+        return time.monotonic_ns()
+
     def sleep(self, seconds: float) -> None:
         time.sleep(seconds)
 
@@ -35,7 +44,10 @@ class FrameSource:
     name: str
     payload_len: int = 8
 
-    def step(self, state: Dict[str, Any], rng: random.Random) -> bytearray:
+    # step() writes the next payload into a buffer the generator allocates once per
+    # source (payload_len zero bytes) and reuses for every emission, so a source must
+    # rewrite every byte it uses on each call.
+    def step(self, state: Dict[str, Any], rng: random.Random, payload: bytearray) -> None:
         raise NotImplementedError
 
 @dataclass(frozen=True)
@@ -47,11 +59,10 @@ class CounterSource(FrameSource):
     name: str = "counter_frame"
     payload_len: int = 8
 
-    def step(self, state: Dict[str, Any], rng: random.Random) -> bytearray:
+    def step(self, state: Dict[str, Any], rng: random.Random, payload: bytearray) -> None:
         counter = int(state.get("counter", 0)) % 256
-        payload = bytearray([counter] + [0] * (self.payload_len - 1))
+        payload[0] = counter
         state["counter"] = (counter + 1) % 256
-        return payload
 
 @dataclass(frozen=True)
 class TemperatureSource(FrameSource):
@@ -67,7 +78,7 @@ class TemperatureSource(FrameSource):
     min_deci_c: int = 180    # 18.0C
     max_deci_c: int = 320    # 32.0C
 
-    def step(self, state: Dict[str, Any], rng: random.Random) -> bytearray:
+    def step(self, state: Dict[str, Any], rng: random.Random, payload: bytearray) -> None:
         t = int(state.get("temp_deci_c", self.start_deci_c))
         # Simple bounded sawtooth drift
         direction = int(state.get("temp_dir", 1))
@@ -82,9 +93,7 @@ class TemperatureSource(FrameSource):
         state["temp_deci_c"] = t_next
         state["temp_dir"] = direction
 
-        payload = bytearray([0] * self.payload_len)
-        payload[0:2] = int(t_next).to_bytes(2, byteorder="little", signed=False)
-        return payload
+        _U16LE.pack_into(payload, 0, t_next)
 
 @dataclass(frozen=True)
 class VoltageSource(FrameSource):
@@ -98,27 +107,17 @@ class VoltageSource(FrameSource):
     base_mv: int = 12000
     ripple_mv: int = 30
 
-    def step(self, state: Dict[str, Any], rng: random.Random) -> bytearray:
+    def step(self, state: Dict[str, Any], rng: random.Random, payload: bytearray) -> None:
         phase = int(state.get("phase", 0))
-        # Deterministic triangle-ish ripple
+        # Deterministic triangle-ish ripple: 0 -> +r -> 0 -> -r -> 0 over 4*r phases,
+        # computed branch-free (peak at phase r, trough at phase 3r)
         r = self.ripple_mv
-        cycle = 4 * r
-        x = phase % cycle
-        if x <= r:
-            dv = x
-        elif x <= 2 * r:
-            dv = 2 * r - x
-        elif x <= 3 * r:
-            dv = -(x - 2 * r)
-        else:
-            dv = -(4 * r - x)
+        dv = abs((phase + 3 * r) % (4 * r) - 2 * r) - r
 
         mv = self.base_mv + dv
         state["phase"] = phase + 1
 
-        payload = bytearray([0] * self.payload_len)
-        payload[0:2] = int(mv).to_bytes(2, byteorder="little", signed=False)
-        return payload
+        _U16LE.pack_into(payload, 0, mv)
 
 
 # -------------------------
@@ -129,6 +128,10 @@ class Anomaly(Protocol):
 
     # An anomaly can probabilistically mutate the payload/state for a given frame
     # Return True if it fired, else False
+
+    # Optional target_can_id (int): if present, TrafficGenerator only calls
+    # maybe_apply for frames with that CAN ID, so the anomaly must have no effect
+    # (and draw nothing from rng) for other IDs. Anomalies without it see every frame.
     
     def maybe_apply(
         self,
@@ -196,9 +199,8 @@ class ProbTemperatureSpike:
         while delta == 0:
             delta = rng.randint(lo, hi)
         
-        t = int.from_bytes(payload[0:2], byteorder="little", signed=False)
-        t2 = max(0, min(0xFFFF, t + delta))
-        payload[0:2] = int(t2).to_bytes(2, byteorder="little", signed=False)
+        (t,) = _U16LE.unpack_from(payload, 0)
+        _U16LE.pack_into(payload, 0, max(0, min(0xFFFF, t + delta)))
         return True
     
 @dataclass(frozen=True)
@@ -229,9 +231,8 @@ class ProbVoltageSpike:
         while delta == 0:
             delta = rng.randint(lo, hi)
 
-        mv = int.from_bytes(payload[0:2], byteorder="little", signed=False)
-        mv2 = max(0, min(0xFFFF, mv + delta))
-        payload[0:2] = int(mv2).to_bytes(2, byteorder="little", signed=False)
+        (mv,) = _U16LE.unpack_from(payload, 0)
+        _U16LE.pack_into(payload, 0, max(0, min(0xFFFF, mv + delta)))
         return True
 
 
@@ -270,6 +271,16 @@ class TrafficGenerator:
         self._rng = random.Random(self.seed)
         self._state_by_id: Dict[int, Dict[str, Any]] = {s.can_id: {} for s in self.sources}
 
+    def _anomalies_for(self, can_id: int) -> Tuple[Anomaly, ...]:
+        # Anomalies that can fire on can_id, in their original order. Ones targeting
+        # another ID return before drawing from the RNG, so skipping them keeps the
+        # random sequence (and output for a given seed) unchanged. Anomalies without a
+        # target_can_id apply to every ID.
+        return tuple(
+            a for a in self.anomalies
+            if getattr(a, "target_can_id", can_id) == can_id
+        )
+
     def run(
         self,
         publish,
@@ -283,36 +294,68 @@ class TrafficGenerator:
         if n == 0:
             return 0
 
+        # Per-source (step, can_id, state, payload buffer, anomalies), resolved once per
+        # run so the loop below does no dict lookups or payload allocation; bytes(payload)
+        # is the only copy made per frame.
+        plan = [
+            (
+                src.step,
+                src.can_id,
+                self._state_by_id[src.can_id],
+                bytearray(src.payload_len),
+                self._anomalies_for(src.can_id),
+            )
+            for src in self.sources
+        ]
+        rng = self._rng
+        time_ns = self.clock.time_ns
+        # monotonic_ns joined the Clock protocol after time_ns/sleep; name the gap
+        # instead of failing with a bare AttributeError mid-setup
+        monotonic_ns = getattr(self.clock, "monotonic_ns", None)
+        if monotonic_ns is None:
+            raise TypeError(
+                f"{type(self.clock).__name__} must implement monotonic_ns() to pace TrafficGenerator"
+            )
+        sleep = self.clock.sleep
+        period_ns = self.period_ms * 1_000_000
+        channel = self.channel
+        source_node = self.source_node
+        perf_counter = time.perf_counter
+
+        # Sleep to an absolute deadline so the time spent building and publishing each
+        # frame is absorbed into the period instead of accumulating as drift. If the
+        # loop falls behind, the schedule restarts from now rather than bursting.
+        # The deadline is kept on the injected clock, the same one that sleeps.
+        next_tick = monotonic_ns()
+
         # duration_s=None means run indefinitely until caller stops it.
-        while (duration_s is None) or ((time.perf_counter() - start) < duration_s):
+        while (duration_s is None) or ((perf_counter() - start) < duration_s):
             if should_stop is not None and should_stop():
                 break
 
-            src = self.sources[sent % n]
-            state = self._state_by_id[src.can_id]
-            payload = src.step(state, self._rng)
+            step, can_id, state, payload, anomalies = plan[sent % n]
+            step(state, rng, payload)
 
-            for a in self.anomalies:
+            for a in anomalies:
                 a.maybe_apply(
-                    rng=self._rng,
+                    rng=rng,
                     frame_index=sent,
-                    can_id=src.can_id,
+                    can_id=can_id,
                     payload=payload,
                     state=state,
                 )
 
-            publish(
-                Frame(
-                    timestamp_ns=self.clock.time_ns(),
-                    can_id=src.can_id,
-                    data=bytes(payload),
-                    channel=self.channel,
-                    is_extended_id=False,
-                    source_node=self.source_node,
-                )
-            )
+            # Positional: (timestamp_ns, can_id, data, channel, is_extended_id, dlc, source_node)
+            publish(Frame(time_ns(), can_id, bytes(payload), channel, False, None, source_node))
             sent += 1
-            self.clock.sleep(self.period_ms / 1000.0)
+
+            next_tick += period_ns
+            now = monotonic_ns()
+            delay = next_tick - now
+            if delay > 0:
+                sleep(delay / 1e9)
+            else:
+                next_tick = now
 
         return sent
 
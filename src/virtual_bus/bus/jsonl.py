@@ -1,22 +1,74 @@
 from __future__ import annotations
 
 import json
+import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
+
+DEFAULT_BUFFER_BYTES = 64 * 1024
+
+# Same output as json.dumps(obj) with default arguments, minus its per-call option checks
+_encode = json.JSONEncoder().encode
 
 
 class JsonlWriter:
-    def __init__(self, path: Path) -> None:
+    # Lines are encoded into a user-space buffer and written out in one call once
+    # buffer_bytes is reached (and on flush/close), instead of a write per record.
+    # flush_interval_s additionally flushes on the first append that comes at least
+    # that long after the previous flush, for dense sinks that are tailed live. It is
+    # checked on append, not by a timer: once records stop arriving, the tail stays
+    # buffered until flush/close.
+    # flush_every_n bounds how many records can be lost on a crash (1 = every line).
+
+    def __init__(
+        self,
+        path: Path,
+        buffer_bytes: int = DEFAULT_BUFFER_BYTES,
+        flush_interval_s: Optional[float] = None,
+        flush_every_n: Optional[int] = None,
+    ) -> None:
+        if flush_every_n is not None and flush_every_n < 1:
+            raise ValueError("flush_every_n must be >= 1")
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self._f = self.path.open("w", encoding="utf-8", newline="\n")
+        self._f = self.path.open("wb")
+        self._buffer_bytes = buffer_bytes
+        self._pending: list[bytes] = []
+        self._pending_bytes = 0
+        self._flush_interval_s = flush_interval_s
+        self._flush_every_n = flush_every_n
+        self._last_flush = time.monotonic()
 
     def append(self, obj: dict[str, Any]) -> None:
-        self._f.write(json.dumps(obj) + "\n")
+        # Rows buffered after close() would never be written, so refuse them
+        if self._f.closed:
+            raise ValueError("I/O operation on closed file.")
+        # Newlines are added when the buffer is joined, not concatenated per line
+        line = _encode(obj).encode("utf-8")
+        self._pending.append(line)
+        self._pending_bytes += len(line) + 1
+        if self._pending_bytes >= self._buffer_bytes:
+            self.flush()
+        elif self._flush_every_n is not None and len(self._pending) >= self._flush_every_n:
+            self.flush()
+        elif (
+            self._flush_interval_s is not None
+            and time.monotonic() - self._last_flush >= self._flush_interval_s
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            self._f.write(b"\n".join(self._pending))
+            self._f.write(b"\n")
+            self._pending.clear()
+            self._pending_bytes = 0
         self._f.flush()
+        self._last_flush = time.monotonic()
 
     def close(self) -> None:
         if not self._f.closed:
+            self.flush()
             self._f.close()
 
     def __enter__(self) -> "JsonlWriter":
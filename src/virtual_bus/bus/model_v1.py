@@ -6,8 +6,6 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from .types import Signal, Event
-
 
 DEFAULT_MIN_SAMPLES = 20
 
@@ -52,10 +50,10 @@ Future Work (V2+)
 - Integration into a two-stage (rules + ML) pipeline
 """
 
-def _model_key(sig: Signal) -> str:
+def _model_key(source_can_id: Optional[int], name: str) -> str:
     # Keyed per CAN ID and signal name so multiple streams don't collide
     # Keep string for JSON-serializable dict keys
-    return f"{sig.source_can_id}:{sig.name}"
+    return f"{source_can_id}:{name}"
 
 def _iter_jsonl(path: Path) -> Iterator[dict]:
     with path.open("r", encoding="utf-8") as f:
@@ -66,19 +64,52 @@ def _iter_jsonl(path: Path) -> Iterator[dict]:
             yield json.loads(line)
 
 
+def _warn_event_row(timestamp_ns: int, event_type: str, subject: str, details: Dict[str, Any]) -> dict:
+    # Same dict as Event(..., severity="WARN", ...).to_dict(), built directly since
+    # scoring only ever yields the serialized form
+    return {
+        "timestamp_ns": timestamp_ns,
+        "event_type": event_type,
+        "severity": "WARN",
+        "subject": subject,
+        "details": details,
+        "run_id": None,
+    }
+
+
+# Reused for every row; same output as json.dumps(r, ensure_ascii=False)
+_ROW_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
 def _write_jsonl(path: Path, rows: Iterable[dict]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    encode = _ROW_ENCODER.encode
     with path.open("w", encoding="utf-8") as f:
         for r in rows:
-            f.write(json.dumps(r, ensure_ascii=False) + "\n")
+            f.write(encode(r))
+            f.write("\n")
+
+
+_INF = float("inf")
 
 
 def _is_number(x: Any) -> bool:
+    # Exact-type fast paths for what json.loads produces (bool is its own type, so it
+    # falls through); nan fails both comparisons
+    t = type(x)
+    if t is int:
+        return True
+    if t is float:
+        return -_INF < x < _INF
     return isinstance(x, (int, float)) and not isinstance(x, bool) and math.isfinite(float(x))
 
 
 def _median(xs: List[float]) -> float:
-    xs = sorted(xs)
+    return _median_sorted(sorted(xs))
+
+
+def _median_sorted(xs: List[float]) -> float:
+    # xs must already be sorted
     n = len(xs)
     if n == 0:
         return 0.0
@@ -88,17 +119,10 @@ def _median(xs: List[float]) -> float:
     return 0.5 * (float(xs[mid - 1]) + float(xs[mid]))
 
 
-def _mad(xs: List[float], med: float) -> float:
-    # Median Absolute Deviation
-    dev = [abs(x - med) for x in xs]
-    return _median(dev)
-
-
-def _percentile(xs: List[float], p: float) -> float:
-    # p in [0, 100]
+def _percentile_sorted(xs: List[float], p: float) -> float:
+    # p in [0, 100]; xs must already be sorted
     if not xs:
         return 0.0
-    xs = sorted(xs)
     if p <= 0:
         return float(xs[0])
     if p >= 100:
@@ -165,28 +189,42 @@ class ModelV1:
 def train_model_from_signals(signals_jsonl: Path, *, min_samples: int = DEFAULT_MIN_SAMPLES) -> Tuple[ModelV1, Dict[str, Any]]:
     # Gather deltas per (source CAN ID, signal name)
     last_by_key: Dict[str, Tuple[int, float]] = {}  # name -> (timestamp_ns, value)
+    # (source_can_id, name) -> model key, so each stream's key string is formatted once
+    keys: Dict[Tuple[Optional[int], str], str] = {}
     deltas: Dict[str, List[float]] = {}
 
     total = 0
     numeric = 0
 
+    # Rows are read as plain dicts (same fields and defaults as Signal.from_dict)
+    # rather than building a Signal per row just to read a few fields
     for row in _iter_jsonl(signals_jsonl):
-        sig = Signal.from_dict(row)
         total += 1
-
-        if sig.quality != "OK":
+        timestamp_ns = int(row["timestamp_ns"])
+        name = str(row["name"])
+        # Same checks Signal.__post_init__ applies, run on every row as Signal.from_dict did
+        if timestamp_ns < 0:
+            raise ValueError("timestamp_ns must be non-negative")
+        if not name:
+            raise ValueError("name must be a non-empty string")
+
+        if row.get("quality", "OK") != "OK":
             continue
-        if not _is_number(sig.value):
+        value = row["value"]
+        if not _is_number(value):
             continue
 
-        v = float(sig.value)
+        v = float(value)
         numeric += 1
-        key = _model_key(sig)
+        stream = (row.get("source_can_id"), name)
+        key = keys.get(stream)
+        if key is None:
+            key = keys[stream] = _model_key(*stream)
         last = last_by_key.get(key)
         if last is not None:
             dv = v - last[1]
             deltas.setdefault(key, []).append(dv)
-        last_by_key[key] = (sig.timestamp_ns, v)
+        last_by_key[key] = (timestamp_ns, v)
 
     per_signal: Dict[str, SignalDeltaStats] = {}
     kept = 0
@@ -194,9 +232,10 @@ def train_model_from_signals(signals_jsonl: Path, *, min_samples: int = DEFAULT_
         if len(ds) < min_samples:
             continue
         med = _median(ds)
-        mad = _mad(ds, med)
-        abs_dev = [abs(d - med) for d in ds]
-        abs_dev_p99 = _percentile(abs_dev, 99.0)
+        # MAD and the p99 fallback share one sorted abs-deviation list
+        abs_dev = sorted([abs(d - med) for d in ds])
+        mad = _median_sorted(abs_dev)
+        abs_dev_p99 = _percentile_sorted(abs_dev, 99.0)
         per_signal[key] = SignalDeltaStats(
             n=len(ds),
             median_delta=med,
@@ -225,94 +264,123 @@ def score_signals_to_events(
     k: float = 8.0,
     min_samples: int = DEFAULT_MIN_SAMPLES,
 ) -> Iterator[dict]:
-    # MAD -> robust sigma approx: 1.4826 * MAD (for normal-like distributions)
     last_by_key: Dict[str, float] = {}
     last_ts_by_key: Dict[str, int] = {}
+    # (source_can_id, name) -> (model key, stats if modeled with >= min_samples else None,
+    # robust_sigma, reject_below), resolved on first sight of each stream.
+    # MAD -> robust sigma approx: 1.4826 * MAD (for normal-like distributions).
+    # reject_below is k * robust_sigma less a 1e-9 relative margin: any abs deviation under
+    # it scores below k whatever the rounding, so the division is only done near or over
+    # the threshold.
+    streams: Dict[Tuple[Optional[int], str], Tuple[str, Optional[SignalDeltaStats], float, float]] = {}
+    per_signal = model.per_signal
+
+    # For a power-of-two modulus (the default 256) the wrap-around increment check is
+    # ((last + 1) ^ got) & mask, so the mods are only computed to report a jump
+    counter_mod = model.counter_mod
+    counter_mask = counter_mod - 1 if counter_mod > 0 and counter_mod & (counter_mod - 1) == 0 else None
 
     for row in _iter_jsonl(signals_jsonl):
-        sig = Signal.from_dict(row)
-        if sig.quality != "OK":
+        timestamp_ns = int(row["timestamp_ns"])
+        name = str(row["name"])
+        # Same row checks as train_model_from_signals
+        if timestamp_ns < 0:
+            raise ValueError("timestamp_ns must be non-negative")
+        if not name:
+            raise ValueError("name must be a non-empty string")
+
+        if row.get("quality", "OK") != "OK":
             continue
-        if not _is_number(sig.value):
+        value = row["value"]
+        if not _is_number(value):
             continue
 
-        v = float(sig.value)
-        name = sig.name
-        key = _model_key(sig)
+        v = float(value)
+        source_can_id = row.get("source_can_id")
+        stream = (source_can_id, name)
+        resolved = streams.get(stream)
+        if resolved is None:
+            key = _model_key(source_can_id, name)
+            stats = per_signal.get(key)
+            if stats is not None and stats.n < min_samples:
+                stats = None
+            robust_sigma = 1.4826 * stats.mad_delta if stats is not None else 0.0
+            reject_below = k * robust_sigma * (1.0 - 1e-9)
+            resolved = streams[stream] = (key, stats, robust_sigma, reject_below)
+        key, stats, robust_sigma, reject_below = resolved
 
         last_v = last_by_key.get(key)
         last_ts = last_ts_by_key.get(key)
         last_by_key[key] = v
-        last_ts_by_key[key] = sig.timestamp_ns
+        last_ts_by_key[key] = timestamp_ns
 
         if last_v is None or last_ts is None:
             continue
 
         # Special-case counter modulo behavior
         if name == "counter":
-            expected = (int(last_v) + 1) % model.counter_mod
-            got = int(v) % model.counter_mod
-            if got != expected:
-                ev = Event(
-                    timestamp_ns=sig.timestamp_ns,
-                    event_type="MODEL_COUNTER_JUMP",
-                    severity="WARN",
-                    subject=name,
-                    details={
-                        "last": int(last_v),
+            last_i = int(last_v)
+            got_i = int(v)
+            if counter_mask is not None:
+                jumped = ((last_i + 1) ^ got_i) & counter_mask
+            else:
+                jumped = (last_i + 1) % counter_mod != got_i % counter_mod
+            if jumped:
+                expected = (last_i + 1) % counter_mod
+                got = got_i % counter_mod
+                yield _warn_event_row(
+                    timestamp_ns,
+                    "MODEL_COUNTER_JUMP",
+                    name,
+                    {
+                        "last": last_i,
                         "expected": expected,
                         "got": got,
                         "rule": "mod_increment",
                         "model_key": key,
-                        "source_can_id": sig.source_can_id,
-                        "source_node": sig.source_node,
+                        "source_can_id": source_can_id,
+                        "source_node": row.get("source_node"),
                     },
                 )
-                yield ev.to_dict()
             continue
 
-        stats = model.per_signal.get(key)
-        if stats is None or stats.n < min_samples:
+        if stats is None:
             continue
 
         dv = v - last_v
         med = stats.median_delta
         mad = stats.mad_delta
 
-        robust_sigma = 1.4826 * mad
         if robust_sigma < 1e-9:
             # MAD==0: stable in clean. If this signal has an explicit analyzer-style spike rule,
             # mirror it exactly: abs(dv) > threshold (strict >).
             rule_thresh = _MIN_DEV_BY_NAME.get(name)
             if rule_thresh is not None:
                 if abs(dv) > rule_thresh:
-                    ev = Event(
-                        timestamp_ns=sig.timestamp_ns,
-                        event_type="MODEL_DELTA_OUTLIER",
-                        severity="WARN",
-                        subject=name,
-                        details={
+                    yield _warn_event_row(
+                        timestamp_ns,
+                        "MODEL_DELTA_OUTLIER",
+                        name,
+                        {
                             "delta": dv,
                             "rule_threshold": rule_thresh,
                             "note": "MAD==0; analyzer parity (abs(delta) > threshold)",
                             "model_key": key,
-                            "source_can_id": sig.source_can_id,
-                            "source_node": sig.source_node,
+                            "source_can_id": source_can_id,
+                            "source_node": row.get("source_node"),
                         },
                     )
-                    yield ev.to_dict()
                 continue
 
             # Otherwise: ML fallback using learned tolerance from clean run
             tol = stats.abs_dev_p99
             margin = 0.0 if tol >= 1.0 else 1.0
             if abs(dv - med) > (tol + margin):
-                ev = Event(
-                    timestamp_ns=sig.timestamp_ns,
-                    event_type="MODEL_DELTA_OUTLIER",
-                    severity="WARN",
-                    subject=name,
-                    details={
+                yield _warn_event_row(
+                    timestamp_ns,
+                    "MODEL_DELTA_OUTLIER",
+                    name,
+                    {
                         "delta": dv,
                         "median_delta": med,
                         "mad_delta": mad,
@@ -322,22 +390,23 @@ def score_signals_to_events(
                         "abs_dev_p99": tol,
                         "threshold": tol + margin,
                         "model_key": key,
-                        "source_can_id": sig.source_can_id,
-                        "source_node": sig.source_node,
+                        "source_can_id": source_can_id,
+                        "source_node": row.get("source_node"),
                     },
                 )
-                yield ev.to_dict()
             continue
 
         # Normal robust-z scoring path when MAD > 0
-        score = abs(dv - med) / robust_sigma
+        dev = abs(dv - med)
+        if dev < reject_below:
+            continue
+        score = dev / robust_sigma
         if score > k:
-            ev = Event(
-                timestamp_ns=sig.timestamp_ns,
-                event_type="MODEL_DELTA_OUTLIER",
-                severity="WARN",
-                subject=name,
-                details={
+            yield _warn_event_row(
+                timestamp_ns,
+                "MODEL_DELTA_OUTLIER",
+                name,
+                {
                     "delta": dv,
                     "median_delta": med,
                     "mad_delta": mad,
@@ -345,11 +414,10 @@ def score_signals_to_events(
                     "score": score,
                     "threshold_k": k,
                     "model_key": key,
-                    "source_can_id": sig.source_can_id,
-                    "source_node": sig.source_node,
+                    "source_can_id": source_can_id,
+                    "source_node": row.get("source_node"),
                 },
             )
-            yield ev.to_dict()
 
 
 def save_model(model: ModelV1, path: Path) -> None:
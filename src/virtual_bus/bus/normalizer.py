@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+import struct
 from pathlib import Path
-from typing import Callable, Union
+from typing import Callable, Optional, Union
 
-from .types import Frame, Signal
+from .types import CAN_STD_ID_MAX, Frame, Signal
 from .jsonl import JsonlWriter
 
 # Old: (name, byte_index, units)
@@ -16,6 +17,55 @@ SignalSpecV2 = tuple[str, str, int, str | None]
 SignalSpec = Union[SignalSpecV1, SignalSpecV2]
 SignalMap = dict[int, list[SignalSpec]]
 
+# Spec resolved once to V2 shape: (name, dtype, offset, units).
+# Invalid spec tuples resolve to (repr(spec), _INVALID_SPEC, 0, None).
+DecodePlan = tuple[tuple[str, str, int, str | None], ...]
+
+_INVALID_SPEC = "<invalid>"
+
+# Plan plus a struct that decodes every field of it in one call, when the layout allows
+Decoder = tuple[DecodePlan, Optional[struct.Struct]]
+
+_NO_DECODER: Decoder = ((), None)
+
+_STRUCT_CODES = {"u8": "B", "u16_le": "H"}
+
+
+def _compile_specs(specs: list[SignalSpec]) -> DecodePlan:
+    plan = []
+    for spec in specs:
+        # V1: (name, idx, units)
+        if len(spec) == 3:
+            name, idx, units = spec
+            plan.append((name, "u8", idx, units))
+        # V2: (name, dtype, offset, units)
+        elif len(spec) == 4:
+            plan.append(tuple(spec))
+        else:
+            plan.append((repr(spec), _INVALID_SPEC, 0, None))
+    return tuple(plan)
+
+
+def _compile_unpacker(plan: DecodePlan) -> Optional[struct.Struct]:
+    # Only for known dtypes at increasing, non-overlapping offsets (the usual layout);
+    # anything else keeps the per-spec decode path and its error reporting
+    if not plan:
+        return None
+    fmt = "<"
+    pos = 0
+    for _name, dtype, offset, _units in plan:
+        code = _STRUCT_CODES.get(dtype)
+        if code is None or type(offset) is not int or offset < pos:
+            return None
+        fmt += "x" * (offset - pos) + code
+        pos = offset + struct.calcsize("<" + code)
+    return struct.Struct(fmt)
+
+
+def _compile_decoder(specs: list[SignalSpec]) -> Decoder:
+    plan = _compile_specs(specs)
+    return plan, _compile_unpacker(plan)
+
 
 class Normalizer:
     # frame -> signals stage
@@ -25,12 +75,23 @@ class Normalizer:
         artifacts_dir: Path,
         mapping: SignalMap,
         publish_signal: Callable[[Signal], None],
+        flush_interval_s: Optional[float] = None,
     ) -> None:
         self.mapping = mapping
         self.publish_signal = publish_signal
-        self.writer = JsonlWriter(artifacts_dir / "signals.jsonl")
+        # flush_interval_s: set for live runs so signals.jsonl keeps up with the bus
+        self.writer = JsonlWriter(artifacts_dir / "signals.jsonl", flush_interval_s=flush_interval_s)
         self.count = 0
 
+        # Specs are resolved once so the per-frame path never re-inspects spec tuple shapes.
+        # Standard (11-bit) IDs index a dense table built up front (empty plan = unmapped);
+        # extended IDs go through a dict filled on first sight of each ID.
+        self._std_decoders: list[Decoder] = [_NO_DECODER] * (CAN_STD_ID_MAX + 1)
+        for can_id, specs in mapping.items():
+            if 0 <= can_id <= CAN_STD_ID_MAX and specs:
+                self._std_decoders[can_id] = _compile_decoder(specs)
+        self._decoders: dict[int, Decoder] = {}
+
     def _emit(self, sig: Signal) -> None:
         self.writer.append(sig.to_dict())
         self.publish_signal(sig)
@@ -53,8 +114,34 @@ class Normalizer:
         return None, {"reason": "unknown_dtype", "dtype": dtype}
 
     def on_frame(self, frame: Frame) -> None:
-        specs = self.mapping.get(frame.can_id)
-        if not specs:
+        if not frame.is_extended_id:
+            plan, unpacker = self._std_decoders[frame.can_id]
+        else:
+            decoder = self._decoders.get(frame.can_id)
+            if decoder is None:
+                specs = self.mapping.get(frame.can_id)
+                decoder = _compile_decoder(specs) if specs else _NO_DECODER
+                self._decoders[frame.can_id] = decoder
+            plan, unpacker = decoder
+
+        # Fast path: every field decoded by one struct call. Short payloads fall through
+        # so each out-of-range spec still gets its own DECODE_ERROR signal.
+        if unpacker is not None and len(frame.data) >= unpacker.size:
+            for (name, _dtype, _offset, units), value in zip(plan, unpacker.unpack_from(frame.data)):
+                self._emit(
+                    Signal(
+                        frame.timestamp_ns,
+                        name,
+                        value,
+                        units,
+                        frame.can_id,
+                        frame.channel,
+                        frame.source_node,
+                    )
+                )
+            return
+
+        if not plan:
             sig = Signal(
                 timestamp_ns=frame.timestamp_ns,
                 name="UNMAPPED",
@@ -68,16 +155,8 @@ class Normalizer:
             self._emit(sig)
             return
 
-        for spec in specs:
-            # V1: (name, idx, units)
-            if len(spec) == 3:
-                name, idx, units = spec
-                dtype = "u8"
-                offset = idx
-            # V2: (name, dtype, offset, units)
-            elif len(spec) == 4:
-                name, dtype, offset, units = spec
-            else:
+        for name, dtype, offset, units in plan:
+            if dtype is _INVALID_SPEC:
                 sig = Signal(
                     timestamp_ns=frame.timestamp_ns,
                     name="DECODE_ERROR",
@@ -87,7 +166,7 @@ class Normalizer:
                     source_channel=frame.channel,
                     source_node=frame.source_node,
                     quality="DECODE_ERROR",
-                    meta={"reason": "invalid_spec_tuple", "spec": repr(spec)},
+                    meta={"reason": "invalid_spec_tuple", "spec": name},
                 )
                 self._emit(sig)
                 continue
@@ -106,14 +185,16 @@ class Normalizer:
                     meta=err,
                 )
             else:
+                # Hot path: positional args skip keyword matching in the dataclass __init__
+                # (timestamp_ns, name, value, units, source_can_id, source_channel, source_node)
                 sig = Signal(
-                    timestamp_ns=frame.timestamp_ns,
-                    name=name,
-                    value=value,
-                    units=units,
-                    source_can_id=frame.can_id,
-                    source_channel=frame.channel,
-                    source_node=frame.source_node,
+                    frame.timestamp_ns,
+                    name,
+                    value,
+                    units,
+                    frame.can_id,
+                    frame.channel,
+                    frame.source_node,
                 )
             self._emit(sig)
 
@@ -10,8 +10,14 @@ from .jsonl import JsonlWriter
 class Observer:
     # Passive capture: subscribes to the bus and records every frame unchanged.
     
-    def __init__(self, artifacts_dir: Path, frames_filename: str = "frames.jsonl") -> None:
-        self.writer = JsonlWriter(artifacts_dir / frames_filename)
+    def __init__(
+        self,
+        artifacts_dir: Path,
+        frames_filename: str = "frames.jsonl",
+        flush_interval_s: Optional[float] = None,
+    ) -> None:
+        # flush_interval_s: set for live runs so frames.jsonl keeps up with the bus
+        self.writer = JsonlWriter(artifacts_dir / frames_filename, flush_interval_s=flush_interval_s)
         self.count = 0
 
     def on_frame(self, frame: Frame) -> None:
@@ -33,7 +33,8 @@ class FrameReplayer:
                 if not line:
                     continue
                 d = json.loads(line)
-                yield Frame.from_dict(d)
+                # Observer output is plain lowercase hex; range/DLC checks still apply
+                yield Frame.from_dict(d, validate=False)
 
     def run(self, publish: Callable[[Frame], None], limit: Optional[int] = None) -> int:
         if self.speed <= 0:
@@ -42,16 +43,30 @@ class FrameReplayer:
         count = 0
         prev_ts: Optional[int] = None
 
+        # timing="relative" sleeps until an absolute deadline, origin + (ts - first_ts) / speed,
+        # so time spent publishing is absorbed instead of accumulating as drift. A gap
+        # longer than max_sleep_s is capped and the origin shifted by the skipped time,
+        # so later frames are not delayed to make up for it.
+        relative = self.timing == "relative"
+        recorded_ns_per_s = 1e9 * self.speed
+        origin = 0.0
+        first_ts = 0
+
         for frame in self._iter_frames():
             if limit is not None and count >= limit:
                 break
 
-            if self.timing == "relative" and prev_ts is not None:
-                dt_ns = frame.timestamp_ns - prev_ts
-                if dt_ns > 0:
-                    sleep_s = (dt_ns / 1e9) / self.speed
-                    if sleep_s > 0:
-                        time.sleep(min(sleep_s, self.max_sleep_s))
+            if relative:
+                if prev_ts is None:
+                    origin = time.perf_counter()
+                    first_ts = frame.timestamp_ns
+                elif frame.timestamp_ns > prev_ts:
+                    delay = origin + (frame.timestamp_ns - first_ts) / recorded_ns_per_s - time.perf_counter()
+                    if delay > self.max_sleep_s:
+                        origin -= delay - self.max_sleep_s
+                        delay = self.max_sleep_s
+                    if delay > 0:
+                        time.sleep(delay)
 
             publish(frame)
             prev_ts = frame.timestamp_ns
@@ -45,30 +45,44 @@ class Frame:
     meta: Dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
-        if self.timestamp_ns < 0:
+        dlc = Frame._check(self.timestamp_ns, self.can_id, self.data, self.is_extended_id, self.dlc)
+        if self.dlc is None:
+            object.__setattr__(self, "dlc", dlc)
+
+    @staticmethod
+    def _check(
+        timestamp_ns: int,
+        can_id: int,
+        data: bytes,
+        is_extended_id: bool,
+        dlc: Optional[int],
+    ) -> int:
+        # Range/DLC checks shared by __post_init__ and from_dict(validate=False);
+        # returns the DLC (inferred from the data length when dlc is None)
+        if timestamp_ns < 0:
             raise ValueError("timestamp_ns must be non-negative")
 
-        if self.is_extended_id:
-            if not (0 <= self.can_id <= CAN_EXT_ID_MAX):
-                raise ValueError(f"Extended CAN ID out of range: {self.can_id:#x}")
+        if is_extended_id:
+            if not (0 <= can_id <= CAN_EXT_ID_MAX):
+                raise ValueError(f"Extended CAN ID out of range: {can_id:#x}")
         else:
-            if not (0 <= self.can_id <= CAN_STD_ID_MAX):
-                raise ValueError(f"Standard CAN ID out of range: {self.can_id:#x}")
+            if not (0 <= can_id <= CAN_STD_ID_MAX):
+                raise ValueError(f"Standard CAN ID out of range: {can_id:#x}")
 
-        if len(self.data) > CAN_CLASSIC_MAX_DLC:
+        if len(data) > CAN_CLASSIC_MAX_DLC:
             raise ValueError(
-                f"Classic CAN data must be <= {CAN_CLASSIC_MAX_DLC} bytes; got {len(self.data)}"
+                f"Classic CAN data must be <= {CAN_CLASSIC_MAX_DLC} bytes; got {len(data)}"
             )
 
-        inferred = len(self.data)
-        if self.dlc is None:
-            object.__setattr__(self, "dlc", inferred)
-        else:
-            if not (0 <= self.dlc <= CAN_CLASSIC_MAX_DLC):
-                raise ValueError(f"dlc out of range for Classic CAN: {self.dlc}")
-            # Enforce DLC == data length to keep things simple
-            if self.dlc != inferred:
-                raise ValueError(f"dlc ({self.dlc}) does not match data length ({inferred})")
+        inferred = len(data)
+        if dlc is None:
+            return inferred
+        if not (0 <= dlc <= CAN_CLASSIC_MAX_DLC):
+            raise ValueError(f"dlc out of range for Classic CAN: {dlc}")
+        # Enforce DLC == data length to keep things simple
+        if dlc != inferred:
+            raise ValueError(f"dlc ({dlc}) does not match data length ({inferred})")
+        return dlc
 
     def to_dict(self) -> Dict[str, Any]:
         # JSONL-friendly serialization (bytes -> hex)
@@ -84,19 +98,63 @@ class Frame:
         }
 
     @staticmethod
-    def from_dict(d: Dict[str, Any]) -> "Frame":
+    def from_dict(d: Dict[str, Any], validate: bool = True) -> "Frame":
         # Inverse of to_dict().
+        # validate=False skips dataclass __init__ and hex normalisation, for rows in the
+        # plain lowercase data.hex() form this package writes (e.g. replaying frames.jsonl).
+        # The range/DLC checks still run: the file may come from anywhere, and later
+        # stages index tables by can_id.
+        dlc = int(d["dlc"]) if d.get("dlc") is not None else None
+        if not validate:
+            timestamp_ns = int(d["timestamp_ns"])
+            can_id = int(d["can_id"])
+            data = bytes.fromhex(d["data_hex"])
+            is_extended_id = bool(d.get("is_extended_id", False))
+            return Frame._unchecked(
+                timestamp_ns,
+                can_id,
+                data,
+                str(d.get("channel", "can0")),
+                is_extended_id,
+                Frame._check(timestamp_ns, can_id, data, is_extended_id, dlc),
+                d.get("source_node"),
+                dict(d.get("meta", {})),
+            )
         return Frame(
             timestamp_ns=int(d["timestamp_ns"]),
             can_id=int(d["can_id"]),
             data=_hex_to_bytes(d["data_hex"]),
             channel=str(d.get("channel", "can0")),
             is_extended_id=bool(d.get("is_extended_id", False)),
-            dlc=int(d["dlc"]) if d.get("dlc") is not None else None,
+            dlc=dlc,
             source_node=d.get("source_node"),
             meta=dict(d.get("meta", {})),
         )
 
+    @staticmethod
+    def _unchecked(
+        timestamp_ns: int,
+        can_id: int,
+        data: bytes,
+        channel: str,
+        is_extended_id: bool,
+        dlc: int,
+        source_node: Optional[str],
+        meta: Dict[str, Any],
+    ) -> "Frame":
+        # Sets the slots directly, bypassing __init__/__post_init__
+        f = object.__new__(Frame)
+        set_ = object.__setattr__
+        set_(f, "timestamp_ns", timestamp_ns)
+        set_(f, "can_id", can_id)
+        set_(f, "data", data)
+        set_(f, "channel", channel)
+        set_(f, "is_extended_id", is_extended_id)
+        set_(f, "dlc", dlc)
+        set_(f, "source_node", source_node)
+        set_(f, "meta", meta)
+        return f
+
 
 SignalValue = Union[int, float, bool, str]
 
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 
 import pytest
 
 from virtual_bus.bus.analyzer import Analyzer
-from virtual_bus.bus.types import Signal
+from virtual_bus.bus.types import FeedRecord, Signal
 
 
 @dataclass
@@ -114,6 +115,19 @@ def test_analyzer_defaults_emit_event_on_voltage_spike(tmp_path) -> None:
     assert ev["details"]["delta_mv"] == -500
 
 
+def test_analyzer_events_reach_disk_without_close(tmp_path) -> None:
+    a = Analyzer(artifacts_dir=tmp_path)
+
+    a.on_signal(Signal(timestamp_ns=100, name="counter", value=10))
+    a.on_signal(Signal(timestamp_ns=200, name="counter", value=99))
+
+    # Live runs tail events.jsonl, so an event must not wait in the buffer
+    rows = (tmp_path / "events.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(rows) == 1
+    assert json.loads(rows[0])["event_type"] == "COUNTER_JUMP"
+    a.close()
+
+
 def test_analyzer_ignores_bad_quality_even_if_watched(tmp_path) -> None:
     a = _make_analyzer(tmp_path, watch_signals={"counter"})
 
@@ -136,3 +150,47 @@ def test_analyzer_watch_signals_filters_events(tmp_path) -> None:
 
     assert a.count == 0
     assert a.writer.rows == []
+
+
+def test_analyzer_watch_signals_skips_non_numeric_unwatched(tmp_path) -> None:
+    a = _make_analyzer(tmp_path, watch_signals={"counter"})
+
+    a.on_signal(Signal(timestamp_ns=100, name="mode", value="auto"))
+
+    assert a.count == 0
+    assert a.writer.rows == []
+
+
+def test_analyzer_tracks_watched_signal_without_rule(tmp_path) -> None:
+    a = _make_analyzer(tmp_path, watch_signals={"counter", "gear"})
+
+    a.on_signal(Signal(timestamp_ns=100, name="gear", value=3))
+
+    assert a._last_by_name == {"gear": 3}
+    assert a.count == 0
+
+
+def test_analyzer_feed_row_matches_feed_record_shape(tmp_path) -> None:
+    a = _make_analyzer(tmp_path)
+    a.feed_writer = DummyWriter()
+
+    sig = Signal(timestamp_ns=100, name="counter", value=7, units="count", source_can_id=0x123, quality="OK")
+    a.on_signal(sig)
+
+    expected = FeedRecord(
+        timestamp_ns=100,
+        record_type="SIGNAL",
+        severity="INFO",
+        subject="counter",
+        details={
+            "value": 7,
+            "units": "count",
+            "quality": "OK",
+            "source_can_id": 0x123,
+            "source_channel": None,
+            "source_node": None,
+            "meta": {},
+        },
+    ).to_dict()
+    assert a.feed_writer.rows == [expected]
+    assert a.feed_count == 1
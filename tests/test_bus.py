@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from virtual_bus.bus.bus import Bus, TypedBus
+
+
+def test_bus_publish_calls_subscribers_in_order() -> None:
+    calls: list[tuple[str, int]] = []
+
+    bus: Bus[int] = Bus()
+    bus.subscribe(lambda m: calls.append(("a", m)))
+    bus.subscribe(lambda m: calls.append(("b", m)))
+
+    bus.publish(1)
+    bus.publish(2)
+
+    assert calls == [("a", 1), ("b", 1), ("a", 2), ("b", 2)]
+
+
+def test_typed_bus_dispatches_by_message_type() -> None:
+    ints: list[int] = []
+    strs: list[str] = []
+
+    bus = TypedBus()
+    bus.subscribe(int, ints.append)
+    bus.subscribe(str, strs.append)
+
+    bus.publish(1)
+    bus.publish("a")
+    bus.publish(2.5)  # no subscribers for float: dropped
+    bus.publish(3)
+
+    assert ints == [1, 3]
+    assert strs == ["a"]
+
+
+def test_bus_subscribe_after_publish_is_seen_by_next_publish() -> None:
+    a: list[int] = []
+    b: list[int] = []
+
+    bus: Bus[int] = Bus()
+    bus.subscribe(a.append)
+    bus.publish(1)
+
+    bus.subscribe(b.append)
+    bus.publish(2)
+
+    assert a == [1, 2]
+    assert b == [2]
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from virtual_bus.bus.jsonl import JsonlWriter
+
+
+def test_jsonl_writer_buffers_until_threshold_and_flushes_on_close(tmp_path: Path) -> None:
+    path = tmp_path / "out.jsonl"
+    w = JsonlWriter(path, buffer_bytes=1024)
+
+    w.append({"a": 1})
+    w.append({"b": "x"})
+    assert path.read_bytes() == b""  # still buffered
+
+    w.close()
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [{"a": 1}, {"b": "x"}]
+
+
+def test_jsonl_writer_writes_once_buffer_is_full(tmp_path: Path) -> None:
+    path = tmp_path / "out.jsonl"
+    with JsonlWriter(path, buffer_bytes=16) as w:
+        w.append({"value": 12345678})  # > 16 bytes encoded
+        assert path.read_bytes() == b'{"value": 12345678}\n'
+
+
+def test_jsonl_writer_flushes_on_interval(tmp_path: Path, monkeypatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr("virtual_bus.bus.jsonl.time.monotonic", lambda: now[0])
+
+    path = tmp_path / "out.jsonl"
+    w = JsonlWriter(path, buffer_bytes=1 << 20, flush_interval_s=0.05)
+
+    w.append({"a": 1})
+    assert path.read_bytes() == b""
+
+    now[0] += 0.06
+    w.append({"a": 2})
+    assert path.read_bytes() == b'{"a": 1}\n{"a": 2}\n'
+    w.close()
+
+
+def test_jsonl_writer_flushes_every_n_records(tmp_path: Path) -> None:
+    path = tmp_path / "out.jsonl"
+    with JsonlWriter(path, buffer_bytes=1 << 20, flush_every_n=2) as w:
+        w.append({"a": 1})
+        assert path.read_bytes() == b""
+
+        w.append({"a": 2})
+        assert path.read_bytes() == b'{"a": 1}\n{"a": 2}\n'
+
+
+def test_jsonl_writer_append_after_close_raises(tmp_path: Path) -> None:
+    w = JsonlWriter(tmp_path / "out.jsonl")
+    w.close()
+
+    with pytest.raises(ValueError):
+        w.append({"a": 1})
@@ -92,3 +92,66 @@ def test_normalizer_emits_multiple_signals_for_one_frame(tmp_path: Path) -> None
     assert n.count == 2
     assert [s.name for s in published] == ["a", "b"]
     assert [s.value for s in published] == [5, 6]
+
+
+def test_normalizer_handles_v2_and_invalid_specs_per_frame(tmp_path: Path) -> None:
+    published: list[Signal] = []
+
+    mapping = {0x124: [("temp", "u16_le", 0, "deciC"), ("bad",)]}
+    n = Normalizer(tmp_path, mapping, published.append)
+
+    # Specs are resolved once; every frame must still decode identically
+    n.on_frame(Frame(timestamp_ns=1, can_id=0x124, data=b"\xfa\x00"))
+    n.on_frame(Frame(timestamp_ns=2, can_id=0x124, data=b"\xfb\x00"))
+
+    assert n.count == 4
+    assert [s.value for s in published if s.quality == "OK"] == [250, 251]
+
+    errs = [s for s in published if s.quality == "DECODE_ERROR"]
+    assert len(errs) == 2
+    assert errs[0].name == "DECODE_ERROR"
+    assert errs[0].meta == {"reason": "invalid_spec_tuple", "spec": repr(("bad",))}
+
+
+def test_normalizer_maps_extended_ids_by_full_can_id(tmp_path: Path) -> None:
+    published: list[Signal] = []
+
+    mapping = {0x18FEF100: [("ext", 0, "u")], 0x100: [("std", 0, "u")]}
+    n = Normalizer(tmp_path, mapping, published.append)
+
+    n.on_frame(Frame(timestamp_ns=1, can_id=0x18FEF100, data=b"\x07", is_extended_id=True))
+    n.on_frame(Frame(timestamp_ns=2, can_id=0x100, data=b"\x08"))
+    # Extended ID whose low bits alias a mapped standard ID stays unmapped
+    n.on_frame(Frame(timestamp_ns=3, can_id=0x1000100, data=b"\x09", is_extended_id=True))
+
+    assert [(s.name, s.value, s.quality) for s in published] == [
+        ("ext", 7, "OK"),
+        ("std", 8, "OK"),
+        ("UNMAPPED", 0, "UNMAPPED"),
+    ]
+
+
+def test_normalizer_mixed_layout_matches_per_spec_decode(tmp_path: Path) -> None:
+    published: list[Signal] = []
+
+    # u8 at 0, u16_le at 2 (gap at 1) decodes in one struct call; out-of-order
+    # offsets and short payloads must give the same result as the per-spec path
+    mapping = {
+        0x200: [("a", 0, "u"), ("b", "u16_le", 2, "mV")],
+        0x201: [("hi", 1, "u"), ("lo", 0, "u")],
+    }
+    n = Normalizer(tmp_path, mapping, published.append)
+
+    n.on_frame(Frame(timestamp_ns=1, can_id=0x200, data=b"\x05\xff\x34\x12"))
+    n.on_frame(Frame(timestamp_ns=2, can_id=0x201, data=b"\x01\x02"))
+    n.on_frame(Frame(timestamp_ns=3, can_id=0x200, data=b"\x05\xff\x34"))
+
+    assert [(s.name, s.value, s.quality) for s in published] == [
+        ("a", 5, "OK"),
+        ("b", 0x1234, "OK"),
+        ("hi", 2, "OK"),
+        ("lo", 1, "OK"),
+        ("a", 5, "OK"),
+        ("b", 0, "DECODE_ERROR"),
+    ]
+    assert published[-1].meta == {"reason": "u16_le_out_of_range", "offset": 2, "len": 3}
@@ -112,3 +112,51 @@ def test_timing_relative_sleeps_scaled_and_capped(tmp_path: Path, monkeypatch: p
     assert sleeps[0] == pytest.approx(0.25)
     # dt=2.0s => /speed=2 => 1.0s capped to 0.25
     assert sleeps[1] == pytest.approx(0.25)
+
+
+def test_timing_relative_long_gap_does_not_delay_later_frames(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # A capped gap shifts the schedule: the next frame waits only its own dt,
+    # not the time skipped by the cap
+    frames_path = tmp_path / "frames.jsonl"
+    _write_frames_jsonl(
+        frames_path,
+        [
+            Frame(timestamp_ns=0, can_id=0x1, data=b"\x00"),
+            Frame(timestamp_ns=1_000_000_000, can_id=0x1, data=b"\x01"),  # dt = 1.0s
+            Frame(timestamp_ns=1_100_000_000, can_id=0x1, data=b"\x02"),  # dt = 0.1s
+        ],
+    )
+
+    now = [10.0]
+    sleeps: list[float] = []
+
+    def _fake_sleep(s: float) -> None:
+        sleeps.append(s)
+        now[0] += s
+
+    monkeypatch.setattr("virtual_bus.bus.replayer.time.sleep", _fake_sleep)
+    monkeypatch.setattr("virtual_bus.bus.replayer.time.perf_counter", lambda: now[0])
+
+    rep = FrameReplayer(path=frames_path, timing="relative", max_sleep_s=0.25)
+    rep.run(publish=lambda _fr: None)
+
+    assert sleeps == [pytest.approx(0.25), pytest.approx(0.1)]
+
+
+@pytest.mark.parametrize(
+    "row",
+    [
+        {"timestamp_ns": 0, "can_id": -1, "is_extended_id": False, "dlc": 1, "data_hex": "00"},
+        {"timestamp_ns": 0, "can_id": 0x800, "is_extended_id": False, "dlc": 1, "data_hex": "00"},
+        {"timestamp_ns": 0, "can_id": 0x1, "is_extended_id": False, "dlc": 2, "data_hex": "00"},
+    ],
+)
+def test_replayer_rejects_out_of_range_rows(tmp_path: Path, row: dict) -> None:
+    frames_path = tmp_path / "frames.jsonl"
+    frames_path.write_text(json.dumps(row) + "\n", encoding="utf-8")
+
+    rep = FrameReplayer(path=frames_path, timing="none")
+    with pytest.raises(ValueError):
+        rep.run(publish=lambda _f: None)